@@ -8,11 +8,15 @@ from doctest import ELLIPSIS
 from fnmatch import fnmatch
 from textwrap import indent
 
+from hypothesis import settings
 from sybil import Sybil
 from sybil.parsers.doctest import DocTestParser
 
 from hissp.reader import Lissp
 
+# For a quicker (if shallower) run: pytest --hypothesis-profile=fast
+settings.register_profile("fast", max_examples=10)
+
 LISSP = re.compile(r" *#> .*\n(?: *#\.\..*\n)*")
 STRIP_LISSP = re.compile(r"(?m)^ *#(?:> |\.\.)")
 
@@ -7,7 +7,6 @@ Hissp's command-line interface.
 import argparse
 import re
 import sys
-import traceback
 
 import hissp.repl
 from hissp import VERSION
@@ -49,9 +48,10 @@ def _interact(code: str, env: Env):
     try:
         repl.lissp.compile(code)
     except:
-        traceback.print_exc()
+        repl.showtraceback()
     finally:
         repl.lissp.compiler.evaluate = False
+        hissp.repl.load_history()
         repl.interact()
 
 
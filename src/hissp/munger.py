@@ -45,9 +45,12 @@ import re
 import unicodedata
 from collections.abc import Hashable, Mapping
 from contextlib import suppress
+from functools import lru_cache
+from types import MappingProxyType
 from typing import TypeVar
 
 
+@lru_cache(maxsize=4096)
 def munge(s: str) -> str:
     """
     Lissp's symbol munger.
@@ -57,12 +60,15 @@ def munge(s: str) -> str:
     using NFKC normalization and `Quotez`.
 
     Full stops are handled separately, as those are meaningful to Hissp.
+
+    Results are cached, since the reader munges the same symbols often.
     """
     # Always normalize identifiers:
     # >>> 𝐀 = 'MATHEMATICAL BOLD CAPITAL A'
     # >>> 'A' in globals()
     # True
-    s = unicodedata.normalize("NFKC", s)
+    if not s.isascii():  # ASCII is already normalized.
+        s = unicodedata.normalize("NFKC", s)
     if s.isidentifier():
         return s  # Nothing to munge.
     return ".".join(_munge_part(part) for part in s.split("."))
@@ -70,7 +76,7 @@ def munge(s: str) -> str:
 
 def _munge_part(part):
     if part:
-        part = "".join(map(qz_encode, part))
+        part = part.translate(_QZ_TABLE)
         if not part.isidentifier():
             part = force_qz_encode(part[0]) + part[1:]
             assert part.isidentifier(), f"{part!r} is not identifier"
@@ -83,48 +89,50 @@ QUOTEZ = "Qz{}_"
 FIND_QUOTEZ = re.compile(QUOTEZ.format("([0-9A-Z][0-9A-Zhx]*?)"))
 """Regex pattern to find `Quotez`. Used by `demunge`."""
 
-TO_NAME = {
-    k: QUOTEZ.format(v)
-    for k, v in {
-        # ASCII control characters don't munge to names.
-        "!": "BANG",
-        '"': "QUOT",
-        "#": "HASH",
-        "$": "DOLR",
-        "%": "PCENT",
-        "&": "ET",
-        "'": "APOS",
-        "(": "LPAR",
-        ")": "RPAR",
-        "*": "STAR",
-        "+": "PLUS",
-        # COMMA is fine.
-        "-": "H",  # Hyphen-minus
-        ".": "DOT",  # Doesn't munge by default.
-        "/": "SOL",
-        # Digits only munge if first character.
-        # COLON is fine.
-        ";": "SEMI",
-        "<": "LT",  # Less Than or LefT.
-        "=": "EQ",
-        ">": "GT",  # Greater Than or riGhT.
-        "?": "QUERY",
-        "@": "AT",
-        # Capital letters are always valid in Python identifiers.
-        "[": "LSQB",
-        "\\": "BSOL",
-        "]": "RSQB",
-        "^": "HAT",
-        # Underscore is valid in Python identifiers.
-        "`": "GRAVE",
-        # Small letters are also always valid.
-        "{": "LCUB",
-        "|": "VERT",
-        "}": "RCUB",
-        # TILDE is fine.
-    }.items()
-}
-"""Shorter names for `Quotez`."""
+TO_NAME = MappingProxyType(
+    {
+        k: QUOTEZ.format(v)
+        for k, v in {
+            # ASCII control characters don't munge to names.
+            "!": "BANG",
+            '"': "QUOT",
+            "#": "HASH",
+            "$": "DOLR",
+            "%": "PCENT",
+            "&": "ET",
+            "'": "APOS",
+            "(": "LPAR",
+            ")": "RPAR",
+            "*": "STAR",
+            "+": "PLUS",
+            # COMMA is fine.
+            "-": "H",  # Hyphen-minus
+            ".": "DOT",  # Doesn't munge by default.
+            "/": "SOL",
+            # Digits only munge if first character.
+            # COLON is fine.
+            ";": "SEMI",
+            "<": "LT",  # Less Than or LefT.
+            "=": "EQ",
+            ">": "GT",  # Greater Than or riGhT.
+            "?": "QUERY",
+            "@": "AT",
+            # Capital letters are always valid in Python identifiers.
+            "[": "LSQB",
+            "\\": "BSOL",
+            "]": "RSQB",
+            "^": "HAT",
+            # Underscore is valid in Python identifiers.
+            "`": "GRAVE",
+            # Small letters are also always valid.
+            "{": "LCUB",
+            "|": "VERT",
+            "}": "RCUB",
+            # TILDE is fine.
+        }.items()
+    }
+)
+"""Shorter names for `Quotez`. Read-only, since munging is cached."""
 
 _QZ_NAME = {ord(k): ord(v) for k, v in {" ": "x", "-": "h"}.items()}
 
@@ -151,6 +159,23 @@ def force_qz_encode(c: str) -> str:
     return QUOTEZ.format(f"{ord(c):#X}")
 
 
+class _QzTable(dict):
+    """`str.translate` table of `qz_encode` results.
+
+    Holds all of ASCII, plus up to ``maxsize`` more characters as seen.
+    """
+
+    maxsize = 4096
+
+    def __missing__(self, k: int) -> str:
+        result = qz_encode(chr(k))
+        if len(self) < 128 + self.maxsize:
+            self[k] = result
+        return result
+
+
+_QZ_TABLE = _QzTable({k: qz_encode(chr(k)) for k in range(128)})
+
 K = TypeVar("K", bound=Hashable)
 V = TypeVar("V")
 
@@ -161,23 +186,30 @@ def _inverse_1to1(mapping: Mapping[K, V]) -> dict[V, K]:
     return result
 
 
-LOOKUP_NAME = _inverse_1to1(TO_NAME)
-"""The inverse of `TO_NAME`."""
+LOOKUP_NAME = MappingProxyType(_inverse_1to1(TO_NAME))
+"""The inverse of `TO_NAME`. Also read-only."""
 
 _UN_QZ_NAME = _inverse_1to1(_QZ_NAME)
 
+_UN_SHORT_NAME = {FIND_QUOTEZ.fullmatch(k)[1]: v for k, v in LOOKUP_NAME.items()}
+
 
 def _qz_decode(match: re.Match[str]) -> str:
+    return _qz_decode_name(match.group(1)) or match.group()
+
+
+def _qz_decode_name(name: str) -> str | None:
     with suppress(KeyError):
-        return LOOKUP_NAME[match.group()]
+        return _UN_SHORT_NAME[name]
     with suppress(KeyError):
-        return unicodedata.lookup(match.group(1).translate(_UN_QZ_NAME))
+        return unicodedata.lookup(name.translate(_UN_QZ_NAME))
     with suppress(ValueError):
-        if match.group(1).startswith("0X"):
-            return chr(int(match.group(1), 16))
-    return match.group()
+        if name.startswith("0X"):
+            return chr(int(name, 16))
+    return None
 
 
+@lru_cache(maxsize=4096)
 def demunge(s: str) -> str:
     """The inverse of :func:`munge`. Decodes any `Quotez` into characters.
 
@@ -188,7 +220,7 @@ def demunge(s: str) -> str:
     which Unicode characters have names depends on the Python version.
 
     ``demunge`` will also leave the remaining text as-is, along with any
-    invalid Quotez.
+    invalid Quotez. Results are cached, like those of :func:`munge`.
 
     >>> demunge("QzFOO_QzGT_QzHYPHENhMINUS_Qz0X3E_bar")
     'QzFOO_>->bar'
@@ -153,13 +153,12 @@ class Lexer(Iterator):
 
     def _it(self) -> Iterator[Token]:
         pos = 0
-        while pos < len(self.code):
-            match = TOKENS.match(self.code, pos)
-            assert match is not None
+        for match in TOKENS.finditer(self.code):
+            assert match.start() == pos, "TOKENS skipped some code"
             assert match.lastgroup
-            assert match.end() > pos, match.groups()
             pos = match.end()
             yield Token((match.lastgroup, match.group(), pos))
+        assert pos == len(self.code), "TOKENS skipped some code"
 
     def position(self, pos: int) -> tuple[str, int, int, str]:
         """
@@ -4,13 +4,15 @@
 The Lissp Read-Evaluate-Print Loop. For interactive use.
 """
 
+import atexit
+import os
 import sys
 from code import InteractiveConsole
 from contextlib import suppress
 from types import ModuleType, SimpleNamespace
 
 from hissp.compiler import CompileError
-from hissp.reader import Lissp, SoftSyntaxError
+from hissp.reader import TOKENS, Lissp, SoftSyntaxError
 
 
 ps1 = "#> "
@@ -21,6 +23,10 @@ ps2 = "#.."
 """String specifying the secondary (continuation) prompt of the `LisspREPL`."""
 
 
+history_file = "~/.lissp_history"
+"""Where the `lissp command`'s REPL keeps its `readline` history."""
+
+
 class LisspREPL(InteractiveConsole):
     """Lissp's `Read-Evaluate-Print Loop`, layered on Python's.
 
@@ -39,6 +45,11 @@ class LisspREPL(InteractiveConsole):
 
     def runsource(self, source, filename="<input>", symbol="single"):
         """:meta private:"""
+        if not source.strip(" \n"):
+            return False  # Blank line. Nothing to read.
+        if self._incomplete(source):
+            return True  # Don't re-read (and re-inject) until it might close.
+        self._lexed = "", 0  # The reader takes it from here.
         try:
             self.lissp.filename = filename
             source = self.lissp.compile(source)
@@ -55,10 +66,40 @@ class LisspREPL(InteractiveConsole):
             print(f"{sys.ps1}# Compilation failed!", file=sys.stderr)
             self.showtraceback()
             return False
-        print(sys.ps1, source.replace("\n", f"\n{sys.ps2}"), sep="", file=sys.stderr)
+        echo = source.replace("\n", f"\n{sys.ps2}")
+        self.write(f"{sys.ps1}{echo}\n")  # One write, not print's three.
         fn = f"<Compiled Hissp of {filename}:\n{self.lissp.compiler.linenos(source)}\n>"
         return super().runsource(source, fn, symbol)
 
+    def resetbuffer(self):
+        """:meta private:"""
+        super().resetbuffer()
+        self._lexed = "", 0  # Text lexed so far and its paren depth.
+
+    def _incomplete(self, source: str) -> bool:
+        """Cheaply detects an unclosed form or string, without the reader.
+
+        When the source continues what was lexed on the last call
+        (as the buffer does, line by line), only lexes what's new.
+        Errors are left for the reader to report.
+        """
+        text, depth = self._lexed
+        if not source.startswith(text):
+            text, depth = "", 0
+        for match in TOKENS.finditer(source, len(text)):
+            k = match.lastgroup
+            if k == "open":
+                depth += 1
+            elif k == "close":
+                depth -= 1
+            elif k == "continue":
+                self._lexed = source[: match.start()], depth  # Lex it again.
+                return True
+            if depth < 0 or k in {"badspace", "badfrag", "error"}:
+                return False
+        self._lexed = source + "\n", depth  # A token can't span the newline.
+        return depth > 0
+
     def raw_input(self, prompt=""):
         """:meta private:"""
         prompt = {sys.ps2: ps2, sys.ps1: ps1}.get(prompt, prompt)
@@ -72,6 +113,33 @@ class LisspREPL(InteractiveConsole):
         return super().interact(banner, exitmsg)
 
 
+_history_loaded = False
+
+
+def load_history():
+    """:meta private:"""
+    # Only for the lissp command's own REPL. Other LisspREPLs may be
+    # sharing readline's history with Python's REPL.
+    global _history_loaded
+    if _history_loaded or not sys.stdin.isatty():
+        return
+    try:
+        import readline
+    except ImportError:
+        return
+    _history_loaded = True
+    path = os.path.expanduser(history_file)
+    with suppress(OSError):
+        readline.read_history_file(path)
+    readline.set_history_length(1000)
+    atexit.register(_save_history, readline, path)
+
+
+def _save_history(readline, path):
+    with suppress(OSError):
+        readline.write_history_file(path)
+
+
 def interact(locals=None):
     """Convenience function to start a `LisspREPL`.
 
@@ -92,10 +160,12 @@ def interact(locals=None):
 def force_main():
     """:meta private:"""
     # Creates a new ``__main__`` to take the place of the current
-    # ``__main__`` module.
+    # ``__main__`` module, and puts the current directory first on the
+    # path, unless it already is.
     __main__ = ModuleType("__main__")
     sys.modules["__main__"] = __main__
-    sys.path.insert(0, "")
+    if sys.path[:1] != [""]:
+        sys.path.insert(0, "")
     return __main__
 
 
@@ -104,9 +174,13 @@ def main(__main__):
 
     `hissp.macros._macro_` is copied into the module namespace,
     making the bundled `macros` immediately available `unqualified`.
+
+    When reading from a terminal, also loads the `history_file`,
+    which is saved again on exit.
     """
     repl = LisspREPL(locals=__main__.__dict__)
     import hissp.macros  # Here so repl can import before compilation.
 
     repl.locals["_macro_"] = SimpleNamespace(**vars(hissp.macros._macro_))
+    load_history()
     repl.interact()
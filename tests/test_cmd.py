@@ -3,30 +3,73 @@
 import os
 import pathlib
 import subprocess as sp
+from contextlib import ExitStack, redirect_stderr, redirect_stdout, suppress
+from functools import cache
+from io import StringIO
 from sys import executable as python
 from textwrap import dedent
+from types import ModuleType
+from unittest.mock import patch
 
+import hissp.repl
 
-def cmd(cmd, input="", shell=True):
-    return sp.Popen(
-        cmd, stdin=sp.PIPE, stdout=sp.PIPE, stderr=sp.PIPE, text=True, shell=shell
-    ).communicate(input=input)
+
+def popen(cmd, stderr=sp.PIPE):
+    return sp.Popen(cmd, stdin=sp.PIPE, stdout=sp.PIPE, stderr=stderr, text=True)
+
+
+def cmd(cmd, input="", stderr=sp.PIPE):
+    return popen(cmd, stderr).communicate(input=input)
+
+
+class TTY(StringIO):
+    def isatty(self):
+        return True
+
+
+def lissp(input="", stdin=StringIO):
+    # Like cmd(["lissp"], input), but in-process, sparing interpreter startup.
+    out, err, module = StringIO(), StringIO(), ModuleType("__main__")
+    with ExitStack() as stack:
+        stack.enter_context(patch.dict("sys.modules", __main__=module))
+        stack.enter_context(patch("sys.stdin", stdin(input)))
+        stack.enter_context(patch("sys.ps1", ">>> ", create=True))
+        stack.enter_context(patch("sys.ps2", "... ", create=True))
+        for name in ["last_type", "last_value", "last_traceback", "last_exc"]:
+            stack.enter_context(patch(f"sys.{name}", create=True))
+        stack.enter_context(patch("builtins._", create=True))
+        stack.enter_context(redirect_stdout(out))
+        stack.enter_context(redirect_stderr(err))
+        stack.enter_context(suppress(SystemExit))
+        hissp.repl.main(module)
+    return out.getvalue(), err.getvalue()
 
 
 EXIT_MSG = "\nnow exiting LisspREPL...\n"
-BANNER = cmd("lissp")[1][: -len(EXIT_MSG)]
-HISSP_C = (python, "-m", "hissp", "-c")
+HISSP = (python, "-m", "hissp")
+HISSP_C = HISSP + ("-c",)
+
+
+def hissp_repl(input=""):
+    # For sessions that touch modules shared with the test process.
+    return cmd(HISSP, input)
+
+
+@cache
+def banner():
+    return lissp()[1][: -len(EXIT_MSG)]
 
 
 def test_c_args():
-    out, err = cmd('python -m hissp -c "(print sys..argv)" 1 2 3')
-    assert [out, err] == ["['-c', '1', '2', '3']\n", ""]
+    out, _ = cmd(HISSP_C + ("(print sys..argv)", "1", "2", "3"), stderr=sp.STDOUT)
+    assert out == "['-c', '1', '2', '3']\n"  # Nothing on stderr either.
 
 
 def test_reproducible_gensym():
     args = HISSP_C + ("(print `$#G `($#G $#G))",)
-    out, err = once = cmd(args, shell=False)
-    again = cmd(args, shell=False)
+    procs = popen(args), popen(args)  # Both start before either is awaited.
+    once, again = [p.communicate() for p in procs]
+    out, err = once
     assert once == again
     assert err == ""
     assert "_Qz" in out
@@ -35,8 +78,8 @@ def test_reproducible_gensym():
 def test_unique_gensyms():
     err = [None] * 2
     arg = "(print `$#G `($#G $#G))"
-    once, err[0] = cmd(HISSP_C + (arg,), shell=False)
-    again, err[1] = cmd(HISSP_C + ("0 " + arg,), shell=False)
+    procs = popen(HISSP_C + (arg,)), popen(HISSP_C + ("0 " + arg,))
+    (once, err[0]), (again, err[1]) = [p.communicate() for p in procs]
     assert err == ["", ""]
     assert once != again
     assert "_Qz" in once
@@ -45,45 +88,46 @@ def test_unique_gensyms():
 
 def test_ic_args():
     out, err = cmd(
-        'lissp -i -c "(print sys..argv)(define answer 42)" 1 2 3', "answer\n"
+        HISSP + ("-i", "-c", "(print sys..argv)(define answer 42)", "1", "2", "3"),
+        "answer\n",
     )
-    assert [out, err[len(BANNER) :]] == [
+    assert [out, err.removeprefix(banner())] == [
         "['-c', '1', '2', '3']\n#> 42\n#> ",
         ">>> answer\n" + EXIT_MSG,
     ]
 
 
 def test_file_args():
-    out, err = cmd("lissp tests/argv.lissp 1 2 3")
+    out, _ = cmd(["lissp", "tests/argv.lissp", "1", "2", "3"], stderr=sp.STDOUT)
     expected = """\
 ['tests/argv.lissp', '1', '2', '3']
 __name__='__main__' __package__=None
 """
-    assert [out, err] == [expected, ""]
+    assert out == expected
 
 
 def test_i_file_args():
-    out, err = cmd("lissp -i tests/argv.lissp 1 2 3", "answer\n")
+    out, err = cmd(HISSP + ("-i", "tests/argv.lissp", "1", "2", "3"), "answer\n")
     expected = """\
 ['tests/argv.lissp', '1', '2', '3']
 __name__='__main__' __package__=None
 #> 42
 #> """
-    assert [out, err[len(BANNER) :]] == [
+    assert [out, err.removeprefix(banner())] == [
         expected,
         ">>> answer\n" + EXIT_MSG,
     ]
 
 
 def test_repl_read_exception():
-    out, err = cmd("python -m hissp", ".#(operator..truediv 1 0)\n")
+    out, err = cmd(HISSP, ".#(operator..truediv 1 0)\n")
     assert ">>> # Compilation failed!\nTraceback (most recent call last):\n  F" in err
     assert "\nZeroDivisionError: division by zero" in err
     assert out.count("#> ") == 2
 
 
 def test_ic_error():
-    out, err = cmd('lissp -i -c "(define answer 42)(truediv 1 0)"', "answer\n")
+    out, err = cmd(["lissp", "-i", "-c", "(define answer 42)(truediv 1 0)"], "answer\n")
     assert "Hissp abort!" in err
     assert "Traceback (most" in err
     assert 'File "<Compiled Hissp #3 of __main__:\n1 truediv(' in err
@@ -93,14 +137,21 @@ def test_ic_error():
     assert "42" in out
 
 
+def test_ic_read_error():
+    out, err = cmd(["lissp", "-i", "-c", "(print 1) )"])
+    assert "Traceback (most recent call last):\n" in err
+    assert "in _interact\n" not in err
+    assert "SyntaxError: too many `)`s\n" in err
+    assert out == "1\n#> "
+
+
+def transcript(input, out, err, exitmsg=EXIT_MSG, run=lissp):
+    actual_out, actual_err = run(input)
+    assert [actual_out, actual_err.removeprefix(banner())] == [out, err + exitmsg]
+
+
 def repl(input, out: str = "#> " * 2, err: str = "", exitmsg=EXIT_MSG):
-    actual_out, actual_err = cmd("lissp", dedent(input))
-    assert dict(
-        out=actual_out.split("\n"), err=actual_err[len(BANNER) :].split("\n")
-    ) == dict(
-        out=dedent(out).split("\n"),
-        err=(dedent(err) + exitmsg).split("\n"),
-    )
+    transcript(dedent(input), dedent(out), dedent(err), exitmsg)
 
 
 def test_repl_prompt():
@@ -115,6 +166,10 @@ def test_repl_atom():
     )
 
 
+def test_repl_blank():
+    repl("\n  \n1\n", "#> #> #> 1\n#> ", ">>> (1)\n")
+
+
 def test_repl_exit():
     repl("(exit)\n", "#> ", ">>> exit()\n", "")
 
@@ -139,11 +194,11 @@ def test_repl_splice_error():
     repl(",@\n", err=err)
 
 
-def call_response(*session):
+def call_response(*session, run=lissp):
     stream = {k: [] for k in "<>!"}
     for line in session:
         stream[line[0]].append(line[2:])
-    repl(*("".join(stream[k]) for k in "<>!"))
+    transcript(*("".join(stream[k]) for k in "<>!"), run=run)  # Already flush.
 
 
 def test_repl_empty_template_error():
@@ -301,6 +356,55 @@ def test_repl_paren_continue():
     )  # fmt: skip
 
 
+def test_repl_continue_inject_once():
+    call_response(
+        "> #> ", "< (print .#(print 1)\n",
+        "> #..", "< \n",
+        "> #..", "< )\n",
+        "> 1\n",
+        "! >>> print(\n",
+        "! ...   None)\n",
+        "> None\n",
+        "> #> ",
+    )  # fmt: skip
+
+
+def test_repl_continue_read_error():
+    call_response(
+        "> #> ", "< (foo ,\n",
+        "> #..", "< )\n",
+        '!   File "<console>", line 1\n',
+        "!     (foo ,\n",
+        "!          ^\n",
+        "! SyntaxError: unquote outside of template\n",
+        "> #> ",
+    )  # fmt: skip
+
+
+def test_repl_comment_continue():
+    call_response(
+        "> #> ", "< (print 1 ; one\n",
+        "> #..", "< ; two\n",
+        "> #..", "< 2)\n",
+        "! >>> print(\n",
+        "! ...   (1),\n",
+        "! ...   (2))\n",
+        "> 1 2\n",
+        "> #> ",
+    )  # fmt: skip
+
+
+def test_runsource_fresh_source():
+    repl = hissp.repl.LisspREPL(locals=ModuleType("__main__").__dict__)
+    with ExitStack() as stack:
+        stack.enter_context(patch("sys.ps1", ">>> ", create=True))
+        stack.enter_context(patch("sys.ps2", "... ", create=True))
+        stack.enter_context(redirect_stderr(StringIO()))
+        assert repl.runsource('(print "abc" "def" "ghi" "jkl" 1')
+        assert not repl.runsource("(.update (globals) : x 3)")  # Not continued.
+    assert repl.locals["x"] == 3
+
+
 def test_compile_error():
     call_response(
         "> #> ", "< (lambda :x)",
@@ -316,6 +420,23 @@ def test_compile_error():
     )  # fmt: skip
 
 
+def test_repl_main_module():
+    call_response(
+        "> #> ", "< (define x 1)\n",
+        "! >>> # define\n",
+        "! ... __import__('builtins').globals().update(\n",
+        "! ...   x=(1))\n",
+        "> #> ", "< (getattr (sys..modules.get '__main__) 'x None)\n",
+        "! >>> getattr(\n",
+        "! ...   __import__('sys').modules.get(\n",
+        "! ...     '__main__'),\n",
+        "! ...   'x',\n",
+        "! ...   None)\n",
+        "> 1\n",
+        "> #> ",
+    )  # fmt: skip
+
+
 def test_interact():
     call_response(
         "> #> ", "< (.update (globals) : x 1  y 2)\n",
@@ -325,7 +446,7 @@ def test_interact():
         "> #> ", "< (let (x 42) (hissp..interact))\n",
         "! >>> # let\n",
         "! ... (lambda x=(42): __import__('hissp').interact())()\n",
-        f"! {BANNER}",
+        f"! {banner()}",
         "> #> ", "< x\n",
         "! >>> x\n",
         "> 42\n",
@@ -344,7 +465,7 @@ def test_interact_locals():
         "! >>> __import__('hissp').interact(\n",
         "! ...   dict(\n",
         "! ...     x=(7)))\n",
-        f"! {BANNER}",
+        f"! {banner()}",
         "> #> ", "< x\n",
         "! >>> x\n",
         "> 7\n",
@@ -374,7 +495,7 @@ def test_subrepl():
         "! ...       ))\n",
         "! ... )()\n",
         "> Entering sys\n",
-        f"! {BANNER}",
+        f"! {banner()}",
         "> #> ", "< (operator..is_ (vars) (vars sys.))\n",
         "! >>> __import__('operator').is_(\n",
         "! ...   vars(),\n",
@@ -385,6 +506,7 @@ def test_subrepl():
         f"! {EXIT_MSG}",
         "> back in __main__\n",
         "> #> ",
+        run=hissp_repl,
     )  # fmt: skip
 
 
@@ -413,7 +535,7 @@ def test_refresh():
             "! ...       ))\n",
             "! ... )()\n",
             "> Entering __refresh\n",
-            f"! {BANNER}",
+            f"! {banner()}",
             "> #> ", "< foo\n",
             "! >>> foo\n",
             "> 1\n",
@@ -438,7 +560,57 @@ def test_refresh():
             f"! {EXIT_MSG}",
             "> back in __main__\n",
             "> #> ",
+            run=hissp_repl,
         )  # fmt: skip
     finally:
         os.remove("__refresh.py")
         os.remove("__refresh.lissp")
+
+
+class FakeReadline:
+    def __init__(self):
+        self.history = []
+        self.length = -1
+
+    def read_history_file(self, path):
+        self.history += pathlib.Path(path).read_text().splitlines()
+
+    def set_history_length(self, length):
+        self.length = length
+
+    def write_history_file(self, path):
+        lines = self.history[-self.length :]
+        pathlib.Path(path).write_text("".join(f"{x}\n" for x in lines))
+
+
+def history_session(path):
+    readline, saves = FakeReadline(), []
+    with ExitStack() as stack:
+        stack.enter_context(patch.dict("sys.modules", readline=readline))
+        stack.enter_context(patch("hissp.repl.history_file", str(path)))
+        stack.enter_context(patch("hissp.repl._history_loaded", False))
+        stack.enter_context(patch("atexit.register", lambda *a: saves.append(a)))
+        out, _ = lissp("(hissp..interact)\n", TTY)
+    assert out.count("#> ") == 3  # Including the nested REPL's.
+    [(save, *args)] = saves  # Only the outer REPL registers a save.
+    return readline, lambda: save(*args)
+
+
+def test_repl_history(tmp_path):
+    path = tmp_path / "history"
+    path.write_text("(foo)\n")
+    readline, save = history_session(path)
+    assert readline.history == ["(foo)"]  # Loaded once, though nested.
+    assert readline.length == 1000
+    readline.history.append("(bar)")
+    save()
+    assert path.read_text() == "(foo)\n(bar)\n"
+
+
+def test_repl_history_missing(tmp_path):
+    path = tmp_path / "history"
+    readline, save = history_session(path)
+    assert readline.history == []
+    readline.history.append("(bar)")
+    save()
+    assert path.read_text() == "(bar)\n"
@@ -26,25 +26,31 @@ literals = st.recursive(
     | st.dictionaries(quoted, children),
     max_leaves=5,
 )
+picklable = (
+    # literals, plus objects with no literal syntax
+    literals
+    | st.dates()
+    | st.datetimes()
+    | st.decimals(allow_nan=False)
+    | st.fractions()
+    | st.timedeltas()
+    | st.times()
+    | st.uuids()
+)
 
 
 class TestCompileGeneral(TestCase):
-    @given(
-        literals
-        | st.dates()
-        | st.datetimes()
-        | st.decimals(allow_nan=False)
-        | st.fractions()
-        | st.timedeltas()
-        | st.times()
-        | st.uuids()
-    )
+    @classmethod
+    def setUpClass(cls):
+        cls.compiler = compiler.Compiler()
+
+    @given(picklable)
     def test_compile_pickle(self, form):
-        self.assertEqual(form, eval(compiler.Compiler().pickle(form)))
+        self.assertEqual(form, eval(self.compiler.pickle(form)))
 
     @given(literals)
     def test_compile_literal(self, form):
-        self.assertEqual(form, eval(compiler.Compiler().atomic(form)))
+        self.assertEqual(form, eval(self.compiler.atomic(form)))
 
     def test_maybe_macro_error(self):
         with self.assertRaises(compiler.CompileError):
@@ -1,16 +1,16 @@
 # Copyright 2019, 2020, 2021, 2022 Matthew Egan Odendahl
 # SPDX-License-Identifier: Apache-2.0
-import re
 from unittest import TestCase
 
 import hypothesis.strategies as st
 import unicodedata
-from hypothesis import given
+from hypothesis import example, given, settings
 
 from hissp import munger
 
 
 class TestMunger(TestCase):
+    @settings(deadline=None)  # First lookups can load the Unicode name DB.
     @given(st.text(min_size=1))
     def test_demunge(self, s: str):
         x = munger.munge(s)
@@ -27,6 +27,7 @@ class TestMunger(TestCase):
         )
 
     @given(st.text(st.characters(whitelist_categories=["Sm"]), min_size=1))
+    @example("+<=>|~")  # The ASCII math symbols.
     def test_munge_symbol(self, s):
         self.assertTrue(munger.munge(s).isidentifier())
 
@@ -34,6 +35,5 @@ class TestMunger(TestCase):
     def test_un_qz_quote(self, char):
         x = munger.qz_encode(char)
         self.assertTrue(("x" + x).isidentifier())
-        match = re.fullmatch("x(.*?)_", x)
-        if match:
-            self.assertEqual(char, munger._qz_decode(match))
+        if x.startswith("Qz") and x.endswith("_"):
+            self.assertEqual(char, munger._qz_decode_name(x[2:-1]))
@@ -2,8 +2,9 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import math
-from collections import Counter
+import re
 from fractions import Fraction
+from itertools import accumulate, repeat
 from types import SimpleNamespace
 from unittest import TestCase
 from unittest.mock import ANY
@@ -16,6 +17,9 @@ from hissp import reader
 from .util import dedented
 
 UNICODE_ANY_ = [("unicode", ANY, ANY)]
+ESCAPES = str.maketrans({"\\": R"\\", '"': R"\""})
+DEPTHS = {"(": 1, ")": -1}
+UNBALANCED = re.compile(r"too many `\)`s|form missing a `\)`")
 
 
 class TestReader(TestCase):
@@ -24,31 +28,28 @@ class TestReader(TestCase):
 
     @given(st.text("(\n 1)", max_size=20))
     def test_balance(self, lissp):
-        tally = Counter(lissp)
-        if tally["("] != tally[")"]:
+        depths = [*accumulate(map(DEPTHS.get, lissp, repeat(0)), initial=0)]
+        if min(depths) < 0 or depths[-1]:  # Closed before opened, or unclosed.
             self.assertRaisesRegex(
                 SyntaxError,
-                r"too many `\)`s|form missing a `\)`",
+                UNBALANCED,
                 list,
                 self.reader.reads(lissp),
             )
+        else:
+            list(self.reader.reads(lissp))
 
     @given(st.text(max_size=5))
     def test_string(self, lissp):
-        lissp = lissp.replace("\\", "\\\\").replace('"', R"\"")
+        lissp = lissp.translate(ESCAPES)
         lissp = f'"{lissp}"'
         self.assertEqual([*reader.Lexer(lissp)], UNICODE_ANY_)
 
     def test_examples(self):
         for k, v in EXPECTED.items():
             with self.subTest(code=k, parsed=v):
-                print(k)
-                lex_k = [*reader.Lexer(k)]
-                print(lex_k)
                 parsed = [*self.reader.parse(reader.Lexer(k))]
-                print(parsed)
                 self.assertEqual(v, parsed)
-                print("OK")
 
     def test_auto_qualification(self):
         self.assertEqual(